@@ -1,14 +1,21 @@
+import json
 import os
 import re
 from dataclasses import dataclass
-from typing import Any, Dict
+from typing import Any, Dict, Iterable, Set, Tuple
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
 _ENV_PATTERN = re.compile(r"\$\{([A-Z0-9_]+)\}")
+_ENV_SUB = _ENV_PATTERN.sub
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BotConfig:
     exchange: str
     symbol: str
@@ -21,27 +28,28 @@ class BotConfig:
     max_volume_usdt: str
     dry_run: bool
     testnet: bool
+    balance_ttl_sec: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ApiConfig:
     key: str
     secret: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BinanceApiConfig:
     key: str
     secret: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LoggingConfig:
     level: str
     file: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AppConfig:
     bot: BotConfig
     api: ApiConfig
@@ -49,25 +57,83 @@ class AppConfig:
     logging: LoggingConfig
 
 
-def _resolve_env(value: Any) -> Any:
-    if isinstance(value, str):
-        def replacer(match: re.Match) -> str:
-            env_key = match.group(1)
-            return os.getenv(env_key, "")
+_CONFIG_CACHE: Dict[str, Tuple[int, Dict[str, str], AppConfig]] = {}
+
 
-        return _ENV_PATTERN.sub(replacer, value)
+def _resolve_env(value: Any, env: Dict[str, str]) -> Any:
+    if isinstance(value, str):
+        if "${" not in value:
+            return value
+        return _ENV_SUB(lambda match: env.get(match.group(1), ""), value)
     if isinstance(value, dict):
-        return {k: _resolve_env(v) for k, v in value.items()}
+        return {k: _resolve_env(v, env) for k, v in value.items()}
     if isinstance(value, list):
-        return [_resolve_env(v) for v in value]
+        return [_resolve_env(v, env) for v in value]
     return value
 
 
-def load_config(path: str) -> AppConfig:
+def _parse_yaml(path: str) -> Tuple[Dict[str, Any], Set[str]]:
     with open(path, "r", encoding="utf-8") as f:
-        raw: Dict[str, Any] = yaml.safe_load(f)
-
-    resolved = _resolve_env(raw)
+        text = f.read()
+    return yaml.load(text, Loader=_Loader), set(_ENV_PATTERN.findall(text))
+
+
+def _parse_yaml_cached(path: str, mtime_ns: int) -> Tuple[Dict[str, Any], Set[str]]:
+    # Only the unresolved YAML is cached, so secrets from the environment
+    # never reach the disk and env changes are picked up on every load.
+    # JSON rather than pickle: loading the cache must not be able to run code.
+    cache_path = f"{path}.cache.json"
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+        if cached["mtime_ns"] == mtime_ns:
+            return cached["raw"], set(cached["env_names"])
+    except (OSError, KeyError, TypeError, ValueError):
+        pass
+
+    raw, env_names = _parse_yaml(path)
+    try:
+        payload = json.dumps({"mtime_ns": mtime_ns, "raw": raw, "env_names": sorted(env_names)})
+    except (TypeError, ValueError):
+        return raw, env_names
+    # Skip caching YAML that JSON cannot represent exactly (e.g. int keys).
+    if json.loads(payload)["raw"] != raw:
+        return raw, env_names
+
+    tmp_path = f"{cache_path}.tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(payload)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+    return raw, env_names
+
+
+def _env_snapshot(names: Iterable[str]) -> Dict[str, str]:
+    environ = os.environ
+    return {name: environ.get(name, "") for name in names}
+
+
+def load_config(path: str, use_cache: bool = False) -> AppConfig:
+    if not use_cache:
+        raw, env_names = _parse_yaml(path)
+        return _build_config(raw, _env_snapshot(env_names))
+
+    mtime_ns = os.stat(path).st_mtime_ns
+    cached = _CONFIG_CACHE.get(path)
+    if cached is not None and cached[0] == mtime_ns and _env_snapshot(cached[1]) == cached[1]:
+        return cached[2]
+
+    raw, env_names = _parse_yaml_cached(path, mtime_ns)
+    env = _env_snapshot(env_names)
+    config = _build_config(raw, env)
+    _CONFIG_CACHE[path] = (mtime_ns, env, config)
+    return config
+
+
+def _build_config(raw: Dict[str, Any], env: Dict[str, str]) -> AppConfig:
+    resolved = _resolve_env(raw, env)
 
     bot = resolved["bot"]
     api = resolved["api"]
@@ -87,6 +153,7 @@ def load_config(path: str) -> AppConfig:
             max_volume_usdt=str(bot["max_volume_usdt"]),
             dry_run=bool(bot["dry_run"]),
             testnet=bool(bot["testnet"]),
+            balance_ttl_sec=float(bot.get("balance_ttl_sec", 30)),
         ),
         api=ApiConfig(
             key=str(api["key"]),
@@ -1,10 +1,15 @@
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal, InvalidOperation
 from typing import Any, Dict
 
 from bot.exchanges.base import ExchangeBase
 
+logger = logging.getLogger(__name__)
+
+_TWO = Decimal("2")
+
 
 class VolumeBot:
     def __init__(
@@ -18,40 +23,48 @@ class VolumeBot:
         max_volume_usdt: str,
         account_type: str,
         dry_run: bool,
+        balance_ttl_sec: float,
     ) -> None:
         self._exchange = exchange
         self._symbol = symbol
         self._category = category
         self._order_qty = order_qty
+        self._order_qty_dec = self._parse_decimal(order_qty)
         self._interval_sec = interval_sec
         self._fill_delay_ms = fill_delay_ms
         self._dry_run = dry_run
         self._max_volume_usdt = self._parse_decimal(max_volume_usdt)
+        self._has_volume_limit = self._max_volume_usdt > 0
         self._account_type = account_type
         self._total_volume_usdt = Decimal("0")
-        self._log = logging.getLogger(self.__class__.__name__)
+        self._balance_ttl_sec = balance_ttl_sec
+        self._balance_cache: Decimal | None = None
+        self._balance_expires_at = 0.0
+        self._executor = ThreadPoolExecutor(max_workers=1)
 
     def run(self) -> None:
-        self._log.info("Starting volume bot")
+        logger.info("Starting volume bot")
         while True:
             try:
-                if self._max_volume_usdt > 0 and self._total_volume_usdt >= self._max_volume_usdt:
-                    self._log.info(
+                if self._has_volume_limit and self._total_volume_usdt >= self._max_volume_usdt:
+                    logger.info(
                         "Reached max volume in USDT: total=%s limit=%s",
                         self._total_volume_usdt,
                         self._max_volume_usdt,
                     )
                     break
 
-                last_price = self._exchange.get_last_price(self._symbol, self._category)
+                price_future = self._executor.submit(self._exchange.get_last_price, self._symbol, self._category)
                 available_usdt = self._get_available_usdt()
+                last_price = price_future.result()
                 required_usdt = self._estimate_required_usdt(last_price)
                 if available_usdt < required_usdt:
-                    self._log.warning(
+                    logger.warning(
                         "Недостаточно USDT для сделки: доступно=%s требуется=%s",
                         available_usdt,
                         required_usdt,
                     )
+                    self._balance_cache = None
                     time.sleep(self._interval_sec)
                     continue
 
@@ -59,45 +72,50 @@ class VolumeBot:
                 sell_order = self._build_order("Sell", reduce_only=True)
 
                 if self._dry_run:
-                    self._log.info("DRY RUN buy=%s", buy_order)
-                    self._log.info("DRY RUN sell=%s", sell_order)
-                    self._log.info("DRY RUN cycle volume USDT=%s", cycle_volume)
+                    logger.info("DRY RUN buy=%s", buy_order)
+                    logger.info("DRY RUN sell=%s", sell_order)
+                    logger.info("DRY RUN cycle volume USDT=%s", cycle_volume)
                 else:
-                    self._log.info("Placing BUY order")
+                    logger.info("Placing BUY order")
                     buy_resp = self._exchange.place_order(buy_order)
-                    self._log.info("BUY response: %s", buy_resp)
-                    buy_order_id = self._extract_order_id(buy_resp)
+                    logger.info("BUY response: %s", buy_resp)
+                    buy_order_id = self._exchange.extract_order_id(buy_resp)
                     if not buy_order_id:
-                        self._log.warning("BUY failed, skipping SELL")
+                        logger.warning("BUY failed, skipping SELL")
+                        self._balance_cache = None
                         time.sleep(self._interval_sec)
                         continue
                     buy_filled = self._wait_filled(self._symbol, buy_order_id)
                     if not buy_filled:
-                        self._log.warning("BUY not filled, skipping SELL")
+                        logger.warning("BUY not filled, skipping SELL")
+                        self._balance_cache = None
                         time.sleep(self._interval_sec)
                         continue
 
                     time.sleep(self._fill_delay_ms / 1000.0)
 
-                    self._log.info("Placing SELL order")
+                    logger.info("Placing SELL order")
                     sell_resp = self._exchange.place_order(sell_order)
-                    self._log.info("SELL response: %s", sell_resp)
-                    sell_order_id = self._extract_order_id(sell_resp)
+                    logger.info("SELL response: %s", sell_resp)
+                    sell_order_id = self._exchange.extract_order_id(sell_resp)
                     if not sell_order_id:
-                        self._log.warning("SELL failed, volume not counted")
+                        logger.warning("SELL failed, volume not counted")
+                        self._balance_cache = None
                         time.sleep(self._interval_sec)
                         continue
                     sell_filled = self._wait_filled(self._symbol, sell_order_id)
                     if not sell_filled:
-                        self._log.warning("SELL not filled, volume not counted")
+                        logger.warning("SELL not filled, volume not counted")
+                        self._balance_cache = None
                         time.sleep(self._interval_sec)
                         continue
 
                 cycle_volume = self._extract_filled_volume(buy_filled, sell_filled, last_price)
                 self._total_volume_usdt += cycle_volume
-                self._log.info("Total volume USDT=%s", self._total_volume_usdt)
+                logger.info("Total volume USDT=%s", self._total_volume_usdt)
             except Exception as exc:
-                self._log.exception("Cycle error: %s", exc)
+                logger.exception("Cycle error: %s", exc)
+                self._balance_cache = None
 
             time.sleep(self._interval_sec)
 
@@ -115,49 +133,44 @@ class VolumeBot:
         return order
 
     def _estimate_cycle_volume(self, last_price: str) -> Decimal:
-        qty = self._parse_decimal(self._order_qty)
-        price = self._parse_decimal(last_price)
-        return qty * price * Decimal("2")
+        return self._estimate_required_usdt(last_price) * _TWO
 
     def _estimate_required_usdt(self, last_price: str) -> Decimal:
-        qty = self._parse_decimal(self._order_qty)
-        price = self._parse_decimal(last_price)
-        return qty * price
+        return self._order_qty_dec * self._parse_decimal(last_price)
 
     def _get_available_usdt(self) -> Decimal:
+        now = time.monotonic()
+        if self._balance_cache is not None and now < self._balance_expires_at:
+            return self._balance_cache
         balance = self._exchange.get_available_balance(self._account_type, "USDT")
         if balance == "" or balance is None:
-            self._log.warning("Баланс USDT не определён, считаю 0")
+            logger.warning("Баланс USDT не определён, считаю 0")
             return Decimal("0")
-        return self._parse_decimal(balance)
+        self._balance_cache = self._parse_decimal(balance)
+        self._balance_expires_at = now + self._balance_ttl_sec
+        return self._balance_cache
 
     @staticmethod
     def _parse_decimal(value: str) -> Decimal:
         try:
-            return Decimal(str(value))
+            return Decimal(value) if isinstance(value, str) else Decimal(str(value))
         except (InvalidOperation, ValueError) as exc:
             raise ValueError(f"Invalid decimal value: {value}") from exc
 
-    @staticmethod
-    def _extract_order_id(response: Dict[str, Any]) -> str:
-        if "result" in response and isinstance(response["result"], dict):
-            order_id = response["result"].get("orderId")
-            if order_id:
-                return str(order_id)
-        if "orderId" in response:
-            return str(response["orderId"])
-        return ""
-
     def _wait_filled(self, symbol: str, order_id: str) -> Dict[str, Any] | None:
         attempts = 5
-        for _ in range(attempts):
+        # Doubling pauses between polls that add up to attempts * fill_delay_ms.
+        delay = attempts * self._fill_delay_ms / 1000.0 / (2 ** (attempts - 1) - 1)
+        for attempt in range(attempts):
             status = self._exchange.get_order_status(symbol, order_id)
             state = str(status.get("orderStatus") or status.get("status", "")).upper()
             if state in ("FILLED", "PARTIALLY_FILLED"):
                 return status
             if state in ("CANCELED", "REJECTED", "EXPIRED"):
                 return None
-            time.sleep(self._fill_delay_ms / 1000.0)
+            if attempt < attempts - 1:
+                time.sleep(delay)
+                delay *= 2
         return None
 
     def _extract_filled_volume(
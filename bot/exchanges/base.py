@@ -23,6 +23,10 @@ class ExchangeBase(ABC):
     def get_order_status(self, symbol: str, order_id: str) -> Dict[str, Any]:
         pass
 
+    @abstractmethod
+    def extract_order_id(self, response: Dict[str, Any]) -> str:
+        pass
+
     @abstractmethod
     def get_filled_quote(self, order_status: Dict[str, Any]) -> str:
         pass
@@ -35,6 +39,10 @@ class ExchangeBase(ABC):
     def list_open_orders(self, symbol: str | None, category: str) -> Dict[str, Any] | list:
         pass
 
+    @abstractmethod
+    def list_open_orders_raw(self, symbol: str | None, category: str) -> bytes:
+        pass
+
     @abstractmethod
     def get_position_size(self, symbol: str, category: str) -> str:
         pass
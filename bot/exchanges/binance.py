@@ -1,15 +1,30 @@
 import hashlib
 import hmac
+import json
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict
 from urllib.parse import urlencode
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from bot.exchanges.base import ExchangeBase
 from bot.exchanges.registry import register_exchange
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+logger = logging.getLogger(__name__)
+
+
+def _now_ms() -> int:
+    return time.time_ns() // 1_000_000
+
 
 class BinanceFuturesClient(ExchangeBase):
     def __init__(self, api_key: str, api_secret: str, testnet: bool) -> None:
@@ -17,7 +32,23 @@ class BinanceFuturesClient(ExchangeBase):
         self._api_secret = api_secret
         self._testnet = testnet
         self._base_url = "https://testnet.binancefuture.com" if testnet else "https://fapi.binance.com"
-        self._log = logging.getLogger(self.__class__.__name__)
+        self._url_order = f"{self._base_url}/fapi/v1/order"
+        self._url_ticker_price = f"{self._base_url}/fapi/v1/ticker/price"
+        self._url_account = f"{self._base_url}/fapi/v2/account"
+        self._url_open_orders = f"{self._base_url}/fapi/v1/openOrders"
+        self._url_all_open_orders = f"{self._base_url}/fapi/v1/allOpenOrders"
+        self._url_position_risk = f"{self._base_url}/fapi/v2/positionRisk"
+        self._hmac = hmac.new(api_secret.encode("utf-8"), digestmod=hashlib.sha256)
+        self._session = requests.Session()
+        self._session.headers.update({"X-MBX-APIKEY": api_key})
+        self._session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=16,
+                max_retries=Retry(total=2, backoff_factor=0.1),
+            ),
+        )
 
     def is_testnet(self) -> bool:
         return self._testnet
@@ -32,19 +63,19 @@ class BinanceFuturesClient(ExchangeBase):
         }
         if payload.get("reduceOnly") is True:
             mapped["reduceOnly"] = "true"
-        mapped["timestamp"] = int(time.time() * 1000)
+        mapped["timestamp"] = _now_ms()
         mapped["recvWindow"] = 5000
-        return self._post("/fapi/v1/order", mapped)
+        return self._post(self._url_order, mapped)
 
     def get_last_price(self, symbol: str, category: str) -> str:
-        data = self._get("/fapi/v1/ticker/price", {"symbol": symbol})
+        data = self._get(self._url_ticker_price, {"symbol": symbol})
         price = data.get("price")
         if not price:
             raise ValueError("Missing price in Binance ticker response")
         return str(price)
 
     def get_available_balance(self, account_type: str, coin: str) -> str:
-        data = self._get_signed("/fapi/v2/account", {})
+        data = self._get_signed(self._url_account, {})
         balances = data.get("assets", [])
         for item in balances:
             if item.get("asset") == coin:
@@ -53,37 +84,55 @@ class BinanceFuturesClient(ExchangeBase):
 
     def get_order_status(self, symbol: str, order_id: str) -> Dict[str, Any]:
         return self._get_signed(
-            "/fapi/v1/order",
+            self._url_order,
             {"symbol": symbol, "orderId": order_id},
         )
 
+    def extract_order_id(self, response: Dict[str, Any]) -> str:
+        return str(response.get("orderId") or "")
+
     def get_filled_quote(self, order_status: Dict[str, Any]) -> str:
         return str(order_status.get("cumQuote", "0"))
 
     def cancel_all_orders(self, symbol: str | None, category: str) -> Dict[str, Any]:
         if symbol:
-            return self._delete_signed("/fapi/v1/allOpenOrders", {"symbol": symbol})
+            return self._delete_signed(self._url_all_open_orders, {"symbol": symbol})
 
-        open_orders = self._get_signed("/fapi/v1/openOrders", {})
+        open_orders = self._get_signed(self._url_open_orders, {})
         if not isinstance(open_orders, list):
             raise ValueError("Unexpected open orders response")
         symbols = sorted({item.get("symbol") for item in open_orders if item.get("symbol")})
-        results = {}
-        for item_symbol in symbols:
-            results[item_symbol] = self._delete_signed(
-                "/fapi/v1/allOpenOrders",
-                {"symbol": item_symbol},
-            )
+        if not symbols:
+            return {"symbols": symbols, "results": {}}
+
+        def cancel(item_symbol: str) -> Dict[str, Any]:
+            return self._delete_signed(self._url_all_open_orders, {"symbol": item_symbol})
+
+        with ThreadPoolExecutor(max_workers=min(len(symbols), 8)) as executor:
+            results = dict(zip(symbols, executor.map(cancel, symbols)))
         return {"symbols": symbols, "results": results}
 
     def list_open_orders(self, symbol: str | None, category: str) -> list:
+        return self._get_signed(self._url_open_orders, self._open_orders_params(symbol))
+
+    def list_open_orders_raw(self, symbol: str | None, category: str) -> bytes:
+        response = self._send_signed(self._url_open_orders, self._open_orders_params(symbol))
+        self._check_status(response)
+        body = response.content
+        if not body.startswith(b"["):
+            # Not an order list: let the parser report API errors.
+            self._handle_response(response)
+        return body
+
+    @staticmethod
+    def _open_orders_params(symbol: str | None) -> Dict[str, Any]:
         params: Dict[str, Any] = {}
         if symbol:
             params["symbol"] = symbol
-        return self._get_signed("/fapi/v1/openOrders", params)
+        return params
 
     def get_position_size(self, symbol: str, category: str) -> str:
-        data = self._get_signed("/fapi/v2/positionRisk", {})
+        data = self._get_signed(self._url_position_risk, {})
         if not isinstance(data, list):
             return "0"
         for item in data:
@@ -100,63 +149,61 @@ class BinanceFuturesClient(ExchangeBase):
             "type": "MARKET",
             "quantity": qty,
             "reduceOnly": "true",
-            "timestamp": int(time.time() * 1000),
+            "timestamp": _now_ms(),
             "recvWindow": 5000,
         }
-        return self._post("/fapi/v1/order", payload)
+        return self._post(self._url_order, payload)
 
-    def _get(self, path: str, params: Dict[str, Any]) -> Dict[str, Any]:
-        url = f"{self._base_url}{path}"
-        response = requests.get(url, params=params, timeout=10)
+    def _get(self, url: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        response = self._session.get(url, params=params, timeout=10)
         return self._handle_response(response)
 
-    def _post(self, path: str, params: Dict[str, Any]) -> Dict[str, Any]:
-        url = f"{self._base_url}{path}"
-        signed = self._sign_params(params)
-        headers = {"X-MBX-APIKEY": self._api_key}
-        response = requests.post(url, headers=headers, params=signed, timeout=10)
+    def _post(self, url: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        query = self._signed_query(params)
+        response = self._session.post(f"{url}?{query}", timeout=10)
         return self._handle_response(response)
 
-    def _get_signed(self, path: str, params: Dict[str, Any]) -> Dict[str, Any]:
-        url = f"{self._base_url}{path}"
-        signed = self._sign_params(params)
-        headers = {"X-MBX-APIKEY": self._api_key}
-        response = requests.get(url, headers=headers, params=signed, timeout=10)
-        return self._handle_response(response)
+    def _get_signed(self, url: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        return self._handle_response(self._send_signed(url, params))
+
+    def _send_signed(self, url: str, params: Dict[str, Any]) -> requests.Response:
+        query = self._signed_query(params)
+        return self._session.get(f"{url}?{query}", timeout=10)
 
-    def _delete_signed(self, path: str, params: Dict[str, Any]) -> Dict[str, Any]:
-        url = f"{self._base_url}{path}"
-        signed = self._sign_params(params)
-        headers = {"X-MBX-APIKEY": self._api_key}
-        response = requests.delete(url, headers=headers, params=signed, timeout=10)
+    def _delete_signed(self, url: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        query = self._signed_query(params)
+        response = self._session.delete(f"{url}?{query}", timeout=10)
         return self._handle_response(response)
 
-    def _sign_params(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    def _signed_query(self, params: Dict[str, Any]) -> str:
         params = dict(params)
         if "timestamp" not in params:
-            params["timestamp"] = int(time.time() * 1000)
+            params["timestamp"] = _now_ms()
         if "recvWindow" not in params:
             params["recvWindow"] = 5000
         query = urlencode(params, doseq=True)
-        signature = hmac.new(self._api_secret.encode("utf-8"), query.encode("utf-8"), hashlib.sha256).hexdigest()
-        params["signature"] = signature
-        return params
+        mac = self._hmac.copy()
+        mac.update(query.encode("utf-8"))
+        return f"{query}&signature={mac.hexdigest()}"
 
-    def _handle_response(self, response: requests.Response) -> Dict[str, Any]:
+    def _check_status(self, response: requests.Response) -> None:
         if not response.ok:
-            self._log.error(
+            logger.error(
                 "Binance HTTP error: status=%s body=%s",
                 response.status_code,
                 response.text,
             )
             response.raise_for_status()
+
+    def _handle_response(self, response: requests.Response) -> Dict[str, Any]:
+        self._check_status(response)
         try:
-            data = response.json()
+            data = _json_loads(response.content)
             if isinstance(data, dict) and data.get("code") not in (None, 0, "0"):
-                self._log.error("Binance API error: code=%s msg=%s", data.get("code"), data.get("msg"))
+                logger.error("Binance API error: code=%s msg=%s", data.get("code"), data.get("msg"))
             return data
         except ValueError:
-            self._log.error("Binance response is not JSON: %s", response.text)
+            logger.error("Binance response is not JSON: %s", response.text)
             return {}
 
 
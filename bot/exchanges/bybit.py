@@ -7,10 +7,26 @@ from typing import Any, Dict, Optional
 from urllib.parse import urlencode
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from bot.exchanges.base import ExchangeBase
 from bot.exchanges.registry import register_exchange
 
+try:
+    from orjson import dumps as _json_dumps, loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+logger = logging.getLogger(__name__)
+
+
+def _now_ms() -> int:
+    return time.time_ns() // 1_000_000
+
 
 class BybitClient(ExchangeBase):
     def __init__(self, api_key: str, api_secret: str, testnet: bool, recv_window: int) -> None:
@@ -19,16 +35,32 @@ class BybitClient(ExchangeBase):
         self._testnet = testnet
         self._recv_window = recv_window
         self._base_url = "https://api-testnet.bybit.com" if testnet else "https://api.bybit.com"
-        self._log = logging.getLogger(self.__class__.__name__)
+        self._url_order_create = f"{self._base_url}/v5/order/create"
+        self._url_tickers = f"{self._base_url}/v5/market/tickers"
+        self._url_wallet_balance = f"{self._base_url}/v5/account/wallet-balance"
+        self._url_order_realtime = f"{self._base_url}/v5/order/realtime"
+        self._url_order_cancel_all = f"{self._base_url}/v5/order/cancel-all"
+        self._url_position_list = f"{self._base_url}/v5/position/list"
+        self._hmac = hmac.new(api_secret.encode("utf-8"), digestmod=hashlib.sha256)
+        self._sign_key_window = f"{api_key}{recv_window}".encode("utf-8")
+        self._session = requests.Session()
+        self._session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=16,
+                max_retries=Retry(total=2, backoff_factor=0.1),
+            ),
+        )
 
     def is_testnet(self) -> bool:
         return self._testnet
 
     def place_order(self, payload: Dict[str, Any]) -> Dict[str, Any]:
-        return self._post("/v5/order/create", payload)
+        return self._post(self._url_order_create, payload)
 
     def get_last_price(self, symbol: str, category: str) -> str:
-        data = self._get("/v5/market/tickers", {"category": category, "symbol": symbol})
+        data = self._get(self._url_tickers, {"category": category, "symbol": symbol})
         items = data.get("result", {}).get("list", [])
         if not items:
             raise ValueError("Empty ticker response")
@@ -39,7 +71,7 @@ class BybitClient(ExchangeBase):
 
     def get_available_balance(self, account_type: str, coin: str) -> str:
         data = self._get_private(
-            "/v5/account/wallet-balance",
+            self._url_wallet_balance,
             {"accountType": account_type, "coin": coin},
         )
         balances = data.get("result", {}).get("list", [])
@@ -62,7 +94,7 @@ class BybitClient(ExchangeBase):
 
     def get_order_status(self, symbol: str, order_id: str) -> Dict[str, Any]:
         data = self._get_private(
-            "/v5/order/realtime",
+            self._url_order_realtime,
             {"category": "linear", "symbol": symbol, "orderId": order_id},
         )
         items = data.get("result", {}).get("list", [])
@@ -70,6 +102,10 @@ class BybitClient(ExchangeBase):
             raise ValueError("Empty order status response")
         return items[0]
 
+    def extract_order_id(self, response: Dict[str, Any]) -> str:
+        result = response.get("result") or {}
+        return str(result.get("orderId") or "")
+
     def get_filled_quote(self, order_status: Dict[str, Any]) -> str:
         return str(order_status.get("cumExecValue", "0"))
 
@@ -77,17 +113,30 @@ class BybitClient(ExchangeBase):
         payload: Dict[str, Any] = {"category": category}
         if symbol:
             payload["symbol"] = symbol
-        return self._post("/v5/order/cancel-all", payload)
+        return self._post(self._url_order_cancel_all, payload)
 
     def list_open_orders(self, symbol: str | None, category: str) -> Dict[str, Any]:
+        return self._get_private(self._url_order_realtime, self._open_orders_params(symbol, category))
+
+    def list_open_orders_raw(self, symbol: str | None, category: str) -> bytes:
+        response = self._send_private(self._url_order_realtime, self._open_orders_params(symbol, category))
+        self._check_status(response)
+        body = response.content
+        if not body.startswith(b'{"retCode":0,'):
+            # Not a plain success envelope: let the parser report API errors.
+            self._handle_response(response)
+        return body
+
+    @staticmethod
+    def _open_orders_params(symbol: str | None, category: str) -> Dict[str, Any]:
         params: Dict[str, Any] = {"category": category}
         if symbol:
             params["symbol"] = symbol
-        return self._get_private("/v5/order/realtime", params)
+        return params
 
     def get_position_size(self, symbol: str, category: str) -> str:
         data = self._get_private(
-            "/v5/position/list",
+            self._url_position_list,
             {"category": category, "symbol": symbol},
         )
         items = data.get("result", {}).get("list", [])
@@ -98,7 +147,7 @@ class BybitClient(ExchangeBase):
 
     def close_position(self, symbol: str, category: str, size: str) -> Dict[str, Any]:
         return self._post(
-            "/v5/order/create",
+            self._url_order_create,
             {
                 "category": category,
                 "symbol": symbol,
@@ -111,35 +160,34 @@ class BybitClient(ExchangeBase):
 
     def get_wallet_balances(self, account_type: str) -> Dict[str, Any]:
         return self._get_private(
-            "/v5/account/wallet-balance",
+            self._url_wallet_balance,
             {"accountType": account_type},
         )
 
-    def _post(self, path: str, payload: Dict[str, Any]) -> Dict[str, Any]:
-        url = f"{self._base_url}{path}"
-        timestamp = str(int(time.time() * 1000))
-        body = json.dumps(payload, separators=(",", ":"))
+    def _post(self, url: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        timestamp = str(_now_ms())
+        body = _json_dumps(payload)
         signature = self._sign(timestamp, body)
 
         headers = self._headers(signature, timestamp)
 
-        response = requests.post(url, headers=headers, data=body, timeout=10)
+        response = self._session.post(url, headers=headers, data=body, timeout=10)
         return self._handle_response(response)
 
-    def _get(self, path: str, params: Dict[str, Any]) -> Dict[str, Any]:
-        url = f"{self._base_url}{path}"
-        response = requests.get(url, params=params, timeout=10)
+    def _get(self, url: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        response = self._session.get(url, params=params, timeout=10)
         return self._handle_response(response)
 
-    def _get_private(self, path: str, params: Dict[str, Any]) -> Dict[str, Any]:
-        url = f"{self._base_url}{path}"
-        timestamp = str(int(time.time() * 1000))
+    def _get_private(self, url: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        return self._handle_response(self._send_private(url, params))
+
+    def _send_private(self, url: str, params: Dict[str, Any]) -> requests.Response:
+        timestamp = str(_now_ms())
         query = urlencode(params)
-        signature = self._sign(timestamp, query)
+        signature = self._sign(timestamp, query.encode("utf-8"))
         headers = self._headers(signature, timestamp)
 
-        response = requests.get(url, headers=headers, params=params, timeout=10)
-        return self._handle_response(response)
+        return self._session.get(f"{url}?{query}", headers=headers, timeout=10)
 
     def _headers(self, signature: str, timestamp: str) -> Dict[str, str]:
         return {
@@ -151,35 +199,37 @@ class BybitClient(ExchangeBase):
             "Content-Type": "application/json",
         }
 
-    def _sign(self, timestamp: str, body: str) -> str:
-        payload = f"{timestamp}{self._api_key}{self._recv_window}{body}"
-        return hmac.new(
-            self._api_secret.encode("utf-8"),
-            payload.encode("utf-8"),
-            hashlib.sha256,
-        ).hexdigest()
+    def _sign(self, timestamp: str, body: bytes) -> str:
+        mac = self._hmac.copy()
+        mac.update(timestamp.encode("ascii"))
+        mac.update(self._sign_key_window)
+        mac.update(body)
+        return mac.hexdigest()
 
-    def _handle_response(self, response: requests.Response) -> Dict[str, Any]:
+    def _check_status(self, response: requests.Response) -> None:
         if not response.ok:
-            self._log.error(
+            logger.error(
                 "Bybit HTTP error: status=%s body=%s",
                 response.status_code,
                 response.text,
             )
             response.raise_for_status()
 
+    def _handle_response(self, response: requests.Response) -> Dict[str, Any]:
+        self._check_status(response)
+
         data = self._safe_json(response)
         ret_code = data.get("retCode")
         ret_msg = data.get("retMsg")
         if ret_code not in (0, "0", None) and ret_msg:
-            self._log.error("Bybit API error: retCode=%s retMsg=%s", ret_code, ret_msg)
+            logger.error("Bybit API error: retCode=%s retMsg=%s", ret_code, ret_msg)
         return data
 
     def _safe_json(self, response: requests.Response) -> Dict[str, Any]:
         try:
-            return response.json()
+            return _json_loads(response.content)
         except ValueError:
-            self._log.error("Bybit response is not JSON: %s", response.text)
+            logger.error("Bybit response is not JSON: %s", response.text)
             return {}
 
 
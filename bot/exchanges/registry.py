@@ -10,7 +10,7 @@ def register_exchange(name: str, factory: Callable[..., ExchangeBase]) -> None:
 
 
 def get_exchange(name: str) -> Callable[..., ExchangeBase]:
-    key = name.lower()
-    if key not in _FACTORIES:
+    factory = _FACTORIES.get(name.lower())
+    if factory is None:
         raise ValueError(f"Unsupported exchange: {name}")
-    return _FACTORIES[key]
+    return factory
@@ -1,10 +1,16 @@
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+_listener: QueueListener | None = None
 
 
 def setup_logging(level: str, log_file: str) -> None:
+    global _listener
+
     logger = logging.getLogger()
-    if logger.handlers:
+    if _listener is not None or logger.handlers:
         return
 
     logger.setLevel(level.upper())
@@ -20,5 +26,9 @@ def setup_logging(level: str, log_file: str) -> None:
     file_handler = RotatingFileHandler(log_file, maxBytes=1_000_000, backupCount=3)
     file_handler.setFormatter(formatter)
 
-    logger.addHandler(stream_handler)
-    logger.addHandler(file_handler)
+    log_queue: queue.Queue = queue.Queue(-1)
+    _listener = QueueListener(log_queue, stream_handler, file_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
+
+    logger.addHandler(QueueHandler(log_queue))
@@ -1,6 +1,4 @@
-import importlib
 import logging
-import pkgutil
 import sys
 
 from dotenv import load_dotenv
@@ -12,10 +10,8 @@ from bot.logger import setup_logging
 
 
 def _load_exchanges() -> None:
-    import bot.exchanges as exchanges_pkg
-
-    for module in pkgutil.iter_modules(exchanges_pkg.__path__, exchanges_pkg.__name__ + "."):
-        importlib.import_module(module.name)
+    import bot.exchanges.binance  # noqa: F401
+    import bot.exchanges.bybit  # noqa: F401
 
 
 def _build_exchange(config):
@@ -48,6 +44,7 @@ def main() -> int:
         max_volume_usdt=config.bot.max_volume_usdt,
         account_type=config.bot.account_type,
         dry_run=config.bot.dry_run,
+        balance_ttl_sec=config.bot.balance_ttl_sec,
     )
     bot.run()
     return 0
@@ -1,138 +1,199 @@
-import argparse
+import functools
+import importlib
 import json
 import logging
+import os
+from decimal import Decimal, InvalidOperation
+from typing import Any
 
 from dotenv import load_dotenv
 
-from bot.config import load_config
-from bot.exchanges.bybit import BybitClient
-from bot.exchanges.binance import BinanceFuturesClient
+from bot.config import AppConfig, load_config
+from bot.exchanges import ExchangeBase, get_exchange
 from bot.logger import setup_logging
 
+try:
+    from orjson import dumps as _orjson_dumps
+except ImportError:
+    _dumps = functools.partial(json.dumps, ensure_ascii=False)
+else:
+    def _dumps(obj: Any) -> str:
+        return _orjson_dumps(obj).decode("utf-8")
 
-def show_balances() -> None:
+logger = logging.getLogger(__name__)
+
+_DOTENV_KEYS = ("BYBIT_API_KEY", "BYBIT_API_SECRET", "BINANCE_API_KEY", "BINANCE_API_SECRET")
+
+
+class _LazyJSON:
+    __slots__ = ("_obj",)
+
+    def __init__(self, obj: Any) -> None:
+        self._obj = obj
+
+    def __str__(self) -> str:
+        if isinstance(self._obj, bytes):
+            return self._obj.decode("utf-8")
+        return _dumps(self._obj)
+
+
+def _is_zero(value: Any) -> bool:
+    if value is None or value == "":
+        return True
+    try:
+        return Decimal(value if isinstance(value, str) else str(value)) == 0
+    except InvalidOperation:
+        return False
+
+
+@functools.lru_cache(maxsize=1)
+def _maybe_load_dotenv() -> None:
+    environ = os.environ
+    if environ.get("BOT_SKIP_DOTENV") == "1":
+        return
+    if all(key in environ for key in _DOTENV_KEYS):
+        return
     load_dotenv()
-    config = load_config("config.yaml")
+
+
+def _bootstrap() -> AppConfig:
+    _maybe_load_dotenv()
+    config = load_config("config.yaml", use_cache=True)
     setup_logging(config.logging.level, config.logging.file)
+    return config
+
+
+@functools.lru_cache(maxsize=1)
+def _make_client(config: AppConfig) -> ExchangeBase:
+    name = config.bot.exchange
+    module_name = f"bot.exchanges.{name.lower()}"
+    try:
+        importlib.import_module(module_name)
+    except ModuleNotFoundError as exc:
+        if exc.name != module_name:
+            raise
+    return get_exchange(name)(config)
+
+
+def show_balances() -> None:
+    from bot.exchanges.bybit import BybitClient
+
+    config = _bootstrap()
+    bot_cfg = config.bot
+    api_cfg = config.api
 
     client = BybitClient(
-        api_key=config.api.key,
-        api_secret=config.api.secret,
-        testnet=config.bot.testnet,
-        recv_window=config.bot.recv_window,
+        api_key=api_cfg.key,
+        api_secret=api_cfg.secret,
+        testnet=bot_cfg.testnet,
+        recv_window=bot_cfg.recv_window,
     )
 
-    data = client.get_wallet_balances(config.bot.account_type)
-    logging.getLogger(__name__).info("Wallet balances: %s", json.dumps(data, ensure_ascii=False))
+    data = client.get_wallet_balances(bot_cfg.account_type)
+    accounts = (data.get("result") or {}).get("list") or []
+    if not accounts:
+        logger.info("Wallet balances: %s", _LazyJSON(data))
+        return
+    for account in accounts:
+        account_type = account.get("accountType")
+        summary = {key: value for key, value in account.items() if key != "coin"}
+        logger.info("Wallet %s: %s", account_type, _LazyJSON(summary))
+        for coin in account.get("coin") or []:
+            logger.info("Wallet %s %s: %s", account_type, coin.get("coin"), _LazyJSON(coin))
 
 
 def cancel_all_orders() -> None:
-    load_dotenv()
-    config = load_config("config.yaml")
-    setup_logging(config.logging.level, config.logging.file)
+    config = _bootstrap()
+    bot_cfg = config.bot
+    _cancel_all_orders(_make_client(config), bot_cfg.symbol, bot_cfg.category)
 
-    if config.bot.exchange.lower() == "bybit":
-        client = BybitClient(
-            api_key=config.api.key,
-            api_secret=config.api.secret,
-            testnet=config.bot.testnet,
-            recv_window=config.bot.recv_window,
-        )
-    elif config.bot.exchange.lower() == "binance":
-        client = BinanceFuturesClient(
-            api_key=config.binance_api.key,
-            api_secret=config.binance_api.secret,
-            testnet=config.bot.testnet,
-        )
-    else:
-        raise ValueError(f"Unsupported exchange: {config.bot.exchange}")
-
-    result = client.cancel_all_orders(config.bot.symbol, config.bot.category)
-    logging.getLogger(__name__).info("Cancel all orders result: %s", json.dumps(result, ensure_ascii=False))
+
+def _cancel_all_orders(client: ExchangeBase, symbol: str, category: str) -> None:
+    result = client.cancel_all_orders(symbol, category)
+    logger.info("Cancel all orders result: %s", _LazyJSON(result))
 
 
 def list_open_orders() -> None:
-    load_dotenv()
-    config = load_config("config.yaml")
-    setup_logging(config.logging.level, config.logging.file)
+    config = _bootstrap()
+    bot_cfg = config.bot
+    client = _make_client(config)
 
-    if config.bot.exchange.lower() == "bybit":
-        client = BybitClient(
-            api_key=config.api.key,
-            api_secret=config.api.secret,
-            testnet=config.bot.testnet,
-            recv_window=config.bot.recv_window,
-        )
-    elif config.bot.exchange.lower() == "binance":
-        client = BinanceFuturesClient(
-            api_key=config.binance_api.key,
-            api_secret=config.binance_api.secret,
-            testnet=config.bot.testnet,
-        )
-    else:
-        raise ValueError(f"Unsupported exchange: {config.bot.exchange}")
-
-    result = client.list_open_orders(config.bot.symbol, config.bot.category)
-    logging.getLogger(__name__).info("Open orders: %s", json.dumps(result, ensure_ascii=False))
+    raw = client.list_open_orders_raw(bot_cfg.symbol, bot_cfg.category)
+    logger.info("Open orders: %s", _LazyJSON(raw))
 
 
 def close_position() -> None:
-    load_dotenv()
-    config = load_config("config.yaml")
-    setup_logging(config.logging.level, config.logging.file)
+    config = _bootstrap()
+    bot_cfg = config.bot
+    _close_position(_make_client(config), bot_cfg.symbol, bot_cfg.category)
+
 
-    if config.bot.exchange.lower() == "bybit":
-        client = BybitClient(
-            api_key=config.api.key,
-            api_secret=config.api.secret,
-            testnet=config.bot.testnet,
-            recv_window=config.bot.recv_window,
-        )
-    elif config.bot.exchange.lower() == "binance":
-        client = BinanceFuturesClient(
-            api_key=config.binance_api.key,
-            api_secret=config.binance_api.secret,
-            testnet=config.bot.testnet,
-        )
-    else:
-        raise ValueError(f"Unsupported exchange: {config.bot.exchange}")
-
-    size = client.get_position_size(config.bot.symbol, config.bot.category)
-    if str(size) in ("0", "0.0", "0.00", ""):
-        logging.getLogger(__name__).info("No open position for %s", config.bot.symbol)
+def _close_position(client: ExchangeBase, symbol: str, category: str) -> None:
+    size = client.get_position_size(symbol, category)
+    if _is_zero(size):
+        logger.info("No open position for %s", symbol)
         return
-    result = client.close_position(config.bot.symbol, config.bot.category, size)
-    logging.getLogger(__name__).info("Close position result: %s", json.dumps(result, ensure_ascii=False))
+    result = client.close_position(symbol, category, size)
+    logger.info("Close position result: %s", _LazyJSON(result))
 
 
 def close_all() -> None:
-    cancel_all_orders()
-    close_position()
+    config = _bootstrap()
+    bot_cfg = config.bot
+    _close_all(_make_client(config), bot_cfg.symbol, bot_cfg.category)
+
+
+def _close_all(client: ExchangeBase, symbol: str, category: str) -> None:
+    # Cancel first so no resting order can fill after the size is read.
+    _cancel_all_orders(client, symbol, category)
+    _close_position(client, symbol, category)
+
+
+_COMMANDS = {
+    "balances": show_balances,
+    "cancel-all": cancel_all_orders,
+    "open-orders": list_open_orders,
+    "close-position": close_position,
+    "close-all": close_all,
+}
+
+
+def repl() -> None:
+    while True:
+        try:
+            name = input("bot> ").strip()
+        except (EOFError, KeyboardInterrupt):
+            print()
+            return
+        if not name:
+            continue
+        if name in ("quit", "exit"):
+            return
+        command = _COMMANDS.get(name)
+        if command is None:
+            print(f"Unknown command: {name}. Available: {', '.join(_COMMANDS)}, quit")
+            continue
+        try:
+            command()
+        except Exception as exc:
+            logger.exception("Command %s failed: %s", name, exc)
 
 
 def main() -> None:
+    import argparse
+
     parser = argparse.ArgumentParser(description="Bot tools")
     parser.add_argument(
         "command",
-        choices=["balances", "cancel-all", "open-orders", "close-position", "close-all"],
-        help="balances: show wallet balances (Bybit only), cancel-all: cancel all open orders, open-orders: list open orders, close-position: close position by symbol, close-all: cancel orders and close position",
+        choices=[*_COMMANDS, "repl"],
+        help="balances: show wallet balances (Bybit only), cancel-all: cancel all open orders, open-orders: list open orders, close-position: close position by symbol, close-all: cancel orders and close position, repl: run commands interactively in one process",
     )
     args = parser.parse_args()
 
-    if args.command == "balances":
-        show_balances()
-        return
-    if args.command == "cancel-all":
-        cancel_all_orders()
-        return
-    if args.command == "open-orders":
-        list_open_orders()
-        return
-    if args.command == "close-position":
-        close_position()
+    if args.command == "repl":
+        repl()
         return
-    if args.command == "close-all":
-        close_all()
+    _COMMANDS[args.command]()
 
 
 if __name__ == "__main__":